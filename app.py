@@ -9,10 +9,12 @@ from datetime import datetime
 import sys
 
 # Import your existing modules
-from students.studentsservice import add_student, list_students, find_student
-from courses.coursesservice import add_course, list_courses, find_course
-from result.resultsservice import add_result, list_results, results as results_data
-from gradesreport.gradereport import calculate_gpa
+from students.studentsservice import add_student, list_students, find_student, update_student, delete_student
+from courses.coursesservice import add_course, list_courses, find_course, update_course, delete_course
+from result.resultsservice import add_result, list_results, results_for_student, student_totals
+from gradesreport.gradereport import calculate_gpa, gpa_from_totals, standing_for, STANDING_BANDS
+from gradesreport.projection import required_average, minimum_grade
+from gradesreport.diffreport import differential_report
 
 # ==================== UI CONFIGURATION ====================
 class UIConfig:
@@ -63,6 +65,8 @@ class UIConfig:
         ADD = "➕"
         LIST = "📋"
         SEARCH = "🔍"
+        EDIT = "✏️"
+        DELETE = "🗑️"
         CALCULATE = "🧮"
         SUCCESS = "✅"
         ERROR = "❌"
@@ -74,6 +78,18 @@ class UIConfig:
         TROPHY = "🏆"
         BOOK = "📖"
         GRADUATE = "🎓"
+        TARGET = "🎯"
+    
+    # Color and icon per standing letter (bands live in gradesreport)
+    STANDING_STYLES = {
+        "A": (Colors.BRIGHT_GREEN, Icons.TROPHY),
+        "B+": (Colors.GREEN, Icons.STAR),
+        "B": (Colors.YELLOW, "✨"),
+        "C+": (Colors.BRIGHT_YELLOW, "👍"),
+        "C": (Colors.MAGENTA, "📝"),
+        "D": (Colors.RED, "⚠️"),
+        "F": (Colors.BRIGHT_RED, "❌"),
+    }
 
 # ==================== UI UTILITIES ====================
 class UIUtils:
@@ -82,7 +98,11 @@ class UIUtils:
     @staticmethod
     def clear_screen():
         """Clear terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if sys.stdout.isatty():
+            os.system('cls' if os.name == 'nt' else 'clear')
+        else:
+            # Remote sessions and pipes get the ANSI sequence instead
+            print("\033[2J\033[H", end="")
     
     @staticmethod
     def print_center(text, width=60, color=UIConfig.Colors.CYAN):
@@ -170,34 +190,8 @@ class UIUtils:
     @staticmethod
     def format_gpa(gpa):
         """Format GPA with color coding"""
-        if gpa >= 3.7:
-            color = UIConfig.Colors.BRIGHT_GREEN
-            icon = UIConfig.Icons.TROPHY
-            grade = "A"
-        elif gpa >= 3.3:
-            color = UIConfig.Colors.GREEN
-            icon = UIConfig.Icons.STAR
-            grade = "B+"
-        elif gpa >= 3.0:
-            color = UIConfig.Colors.YELLOW
-            icon = "✨"
-            grade = "B"
-        elif gpa >= 2.7:
-            color = UIConfig.Colors.BRIGHT_YELLOW
-            icon = "👍"
-            grade = "C+"
-        elif gpa >= 2.3:
-            color = UIConfig.Colors.MAGENTA
-            icon = "📝"
-            grade = "C"
-        elif gpa >= 2.0:
-            color = UIConfig.Colors.RED
-            icon = "⚠️"
-            grade = "D"
-        else:
-            color = UIConfig.Colors.BRIGHT_RED
-            icon = "❌"
-            grade = "F"
+        grade, _ = standing_for(gpa)
+        color, icon = UIConfig.STANDING_STYLES[grade]
         
         return f"{color}{icon} {gpa:.2f} ({grade}){UIConfig.Colors.RESET}"
 
@@ -270,6 +264,8 @@ class StudentsModule:
             print(f"  {UIConfig.Colors.GREEN}[1]{UIConfig.Colors.RESET} {UIConfig.Icons.LIST}  View All Students")
             print(f"  {UIConfig.Colors.GREEN}[2]{UIConfig.Colors.RESET} {UIConfig.Icons.ADD}  Add New Student")
             print(f"  {UIConfig.Colors.GREEN}[3]{UIConfig.Colors.RESET} {UIConfig.Icons.SEARCH}  Find Student")
+            print(f"  {UIConfig.Colors.GREEN}[4]{UIConfig.Colors.RESET} {UIConfig.Icons.EDIT}  Update Student")
+            print(f"  {UIConfig.Colors.GREEN}[5]{UIConfig.Colors.RESET} {UIConfig.Icons.DELETE}  Delete Student")
             print(f"  {UIConfig.Colors.GREEN}[0]{UIConfig.Colors.RESET} {UIConfig.Icons.BACK}  Return to Main Menu")
             print()
             
@@ -283,6 +279,10 @@ class StudentsModule:
                 StudentsModule.add_new()
             elif choice == "3":
                 StudentsModule.find()
+            elif choice == "4":
+                StudentsModule.update()
+            elif choice == "5":
+                StudentsModule.delete()
             else:
                 UIUtils.print_error("Invalid choice! Please try again.")
                 time.sleep(1)
@@ -307,9 +307,8 @@ class StudentsModule:
         print(f"{UIConfig.Colors.CYAN}Please fill in the student details:{UIConfig.Colors.RESET}\n")
         print(f"{UIConfig.Colors.GRAY}{'─'*50}{UIConfig.Colors.RESET}")
         
-        add_student()
-        
-        UIUtils.print_success("Student added successfully!")
+        if add_student() in ("added", "replaced"):
+            UIUtils.print_success("Student added successfully!")
         time.sleep(1)
     
     @staticmethod
@@ -336,6 +335,28 @@ class StudentsModule:
             
             UIUtils.press_enter()
 
+    @staticmethod
+    def update():
+        """Update a student"""
+        UIUtils.clear_screen()
+        UIUtils.print_header(f"{UIConfig.Icons.EDIT} UPDATE STUDENT")
+        
+        print(f"{UIConfig.Colors.CYAN}Renaming a student ID also moves their results.{UIConfig.Colors.RESET}\n")
+        print(f"{UIConfig.Colors.GRAY}{'─'*50}{UIConfig.Colors.RESET}")
+        
+        update_student()
+        UIUtils.press_enter()
+    
+    @staticmethod
+    def delete():
+        """Delete a student"""
+        UIUtils.clear_screen()
+        UIUtils.print_header(f"{UIConfig.Icons.DELETE} DELETE STUDENT")
+        
+        if UIUtils.confirm_action("Deleting a student also deletes their results. Continue?"):
+            delete_student()
+            UIUtils.press_enter()
+
 # ==================== COURSES MODULE ====================
 class CoursesModule:
     """Courses management module"""
@@ -352,6 +373,8 @@ class CoursesModule:
             print(f"  {UIConfig.Colors.GREEN}[1]{UIConfig.Colors.RESET} {UIConfig.Icons.LIST}  View All Courses")
             print(f"  {UIConfig.Colors.GREEN}[2]{UIConfig.Colors.RESET} {UIConfig.Icons.ADD}  Add New Course")
             print(f"  {UIConfig.Colors.GREEN}[3]{UIConfig.Colors.RESET} {UIConfig.Icons.SEARCH}  Find Course")
+            print(f"  {UIConfig.Colors.GREEN}[4]{UIConfig.Colors.RESET} {UIConfig.Icons.EDIT}  Update Course")
+            print(f"  {UIConfig.Colors.GREEN}[5]{UIConfig.Colors.RESET} {UIConfig.Icons.DELETE}  Delete Course")
             print(f"  {UIConfig.Colors.GREEN}[0]{UIConfig.Colors.RESET} {UIConfig.Icons.BACK}  Return to Main Menu")
             print()
             
@@ -365,6 +388,10 @@ class CoursesModule:
                 CoursesModule.add_new()
             elif choice == "3":
                 CoursesModule.find()
+            elif choice == "4":
+                CoursesModule.update()
+            elif choice == "5":
+                CoursesModule.delete()
             else:
                 UIUtils.print_error("Invalid choice! Please try again.")
                 time.sleep(1)
@@ -389,9 +416,8 @@ class CoursesModule:
         print(f"{UIConfig.Colors.CYAN}Please fill in the course details:{UIConfig.Colors.RESET}\n")
         print(f"{UIConfig.Colors.GRAY}{'─'*50}{UIConfig.Colors.RESET}")
         
-        add_course()
-        
-        UIUtils.print_success("Course added successfully!")
+        if add_course() in ("added", "replaced"):
+            UIUtils.print_success("Course added successfully!")
         time.sleep(1)
     
     @staticmethod
@@ -418,6 +444,28 @@ class CoursesModule:
             
             UIUtils.press_enter()
 
+    @staticmethod
+    def update():
+        """Update a course"""
+        UIUtils.clear_screen()
+        UIUtils.print_header(f"{UIConfig.Icons.EDIT} UPDATE COURSE")
+        
+        print(f"{UIConfig.Colors.CYAN}Renaming a course ID also moves its results.{UIConfig.Colors.RESET}\n")
+        print(f"{UIConfig.Colors.GRAY}{'─'*50}{UIConfig.Colors.RESET}")
+        
+        update_course()
+        UIUtils.press_enter()
+    
+    @staticmethod
+    def delete():
+        """Delete a course"""
+        UIUtils.clear_screen()
+        UIUtils.print_header(f"{UIConfig.Icons.DELETE} DELETE COURSE")
+        
+        if UIUtils.confirm_action("Deleting a course also deletes its results. Continue?"):
+            delete_course()
+            UIUtils.press_enter()
+
 # ==================== RESULTS MODULE ====================
 class ResultsModule:
     """Results management module"""
@@ -468,9 +516,8 @@ class ResultsModule:
         print(f"{UIConfig.Colors.CYAN}Please fill in the result details:{UIConfig.Colors.RESET}\n")
         print(f"{UIConfig.Colors.GRAY}{'─'*50}{UIConfig.Colors.RESET}")
         
-        add_result(find_student, find_course)
-        
-        UIUtils.print_success("Result added successfully!")
+        if add_result(find_student, find_course) in ("added", "replaced"):
+            UIUtils.print_success("Result added successfully!")
         time.sleep(1)
 
 # ==================== GRADE REPORT MODULE ====================
@@ -488,6 +535,8 @@ class GradeReportModule:
             print(f"{UIConfig.Colors.BRIGHT_WHITE}Please select an option:{UIConfig.Colors.RESET}\n")
             print(f"  {UIConfig.Colors.GREEN}[1]{UIConfig.Colors.RESET} {UIConfig.Icons.CALCULATE}  Calculate GPA")
             print(f"  {UIConfig.Colors.GREEN}[2]{UIConfig.Colors.RESET} {UIConfig.Icons.GRADUATE}  View Academic Standing")
+            print(f"  {UIConfig.Colors.GREEN}[3]{UIConfig.Colors.RESET} {UIConfig.Icons.TARGET}  What-If Projection")
+            print(f"  {UIConfig.Colors.GREEN}[4]{UIConfig.Colors.RESET} {UIConfig.Icons.LIST}  Changes Since Last Report")
             print(f"  {UIConfig.Colors.GREEN}[0]{UIConfig.Colors.RESET} {UIConfig.Icons.BACK}  Return to Main Menu")
             print()
             
@@ -499,6 +548,10 @@ class GradeReportModule:
                 GradeReportModule.calculate_gpa()
             elif choice == "2":
                 GradeReportModule.academic_standing()
+            elif choice == "3":
+                GradeReportModule.projection()
+            elif choice == "4":
+                GradeReportModule.changes_report()
             else:
                 UIUtils.print_error("Invalid choice! Please try again.")
                 time.sleep(1)
@@ -518,7 +571,7 @@ class GradeReportModule:
         UIUtils.loading_animation(f"Calculating GPA for {student_id}")
         print()
         
-        gpa = calculate_gpa(student_id, results_data, find_course)
+        gpa = calculate_gpa(student_id, results_for_student(student_id), find_course)
         
         # Display results
         print(f"{UIConfig.Colors.BRIGHT_CYAN}{'='*55}")
@@ -543,6 +596,65 @@ class GradeReportModule:
         print(f"\n{UIConfig.Colors.GRAY}{'─'*55}{UIConfig.Colors.RESET}")
         UIUtils.press_enter()
     
+    @staticmethod
+    def projection():
+        """Show the grade needed next term to reach a target GPA"""
+        UIUtils.clear_screen()
+        UIUtils.print_header(f"{UIConfig.Icons.TARGET} WHAT-IF PROJECTION")
+        
+        student_id = UIUtils.get_input("Student ID")
+        if not student_id:
+            return
+        
+        try:
+            target = float(UIUtils.get_input("Target GPA"))
+            credits = float(UIUtils.get_input("Credit hours next term"))
+            totals = student_totals(student_id, find_course)
+            needed = required_average(totals, target, credits)
+        except (TypeError, ValueError):
+            UIUtils.print_error("Target GPA and credit hours must be positive numbers.")
+            UIUtils.press_enter()
+            return
+        
+        letter = minimum_grade(totals, target, credits)
+        
+        print(f"\n{UIConfig.Colors.BRIGHT_WHITE}Current GPA: {UIUtils.format_gpa(gpa_from_totals(*totals))}")
+        print(f"{UIConfig.Colors.BRIGHT_WHITE}Credits completed: {UIConfig.Colors.CYAN}{totals[1]:g}{UIConfig.Colors.RESET}")
+        print(f"{UIConfig.Colors.BRIGHT_WHITE}Average needed: {UIConfig.Colors.CYAN}{max(needed, 0):.2f}{UIConfig.Colors.RESET}")
+        
+        if letter is None:
+            UIUtils.print_error(f"A GPA of {target:.2f} cannot be reached with {credits:g} credit hours.")
+        else:
+            UIUtils.print_success(f"Minimum grade across all {credits:g} credit hours: {letter}")
+        
+        UIUtils.press_enter()
+    
+    @staticmethod
+    def changes_report():
+        """Recompute students changed since the last report and show the differences"""
+        UIUtils.clear_screen()
+        UIUtils.print_header(f"{UIConfig.Icons.LIST} CHANGES SINCE LAST REPORT")
+        
+        export_path = UIUtils.get_input("Export recomputed students to CSV (blank to skip)", required=False)
+        # A preview, so clerks never consume the changes the scheduled export commits
+        diff = differential_report(find_student, find_course, export_path or None, commit=False)
+        
+        if not diff:
+            UIUtils.print_success("No GPA or standing changes since the last report.")
+            UIUtils.press_enter()
+            return
+        
+        print(f"{UIConfig.Colors.BRIGHT_WHITE}{'Student':<12} {'Status':<9} {'GPA':^15} {'Standing'}{UIConfig.Colors.RESET}")
+        print(f"{UIConfig.Colors.GRAY}{'─'*70}{UIConfig.Colors.RESET}")
+        
+        for row in diff:
+            old_gpa = "-" if row["old_gpa"] is None else f"{row['old_gpa']:.2f}"
+            new_gpa = "-" if row["new_gpa"] is None else f"{row['new_gpa']:.2f}"
+            standing = f"{row['old_standing'] or '-'} → {row['new_standing'] or '-'}"
+            print(f"{row['student_id']:<12} {row['status']:<9} {old_gpa:>6} → {new_gpa:<6} {standing}")
+        
+        UIUtils.press_enter()
+    
     @staticmethod
     def academic_standing():
         """Show academic standing information"""
@@ -551,16 +663,13 @@ class GradeReportModule:
         
         print(f"{UIConfig.Colors.CYAN}Academic Grading Scale:{UIConfig.Colors.RESET}\n")
         
-        # Academic scale table
-        scale = [
-            (4.00, 3.70, "A", "First Class Honors", UIConfig.Colors.BRIGHT_GREEN, UIConfig.Icons.TROPHY),
-            (3.69, 3.30, "B+", "Upper Second Class", UIConfig.Colors.GREEN, UIConfig.Icons.STAR),
-            (3.29, 3.00, "B", "Lower Second Class", UIConfig.Colors.YELLOW, "✨"),
-            (2.99, 2.70, "C+", "Third Class", UIConfig.Colors.BRIGHT_YELLOW, "👍"),
-            (2.69, 2.30, "C", "Pass", UIConfig.Colors.MAGENTA, "📝"),
-            (2.29, 2.00, "D", "Conditional Pass", UIConfig.Colors.RED, "⚠️"),
-            (1.99, 0.00, "F", "Fail", UIConfig.Colors.BRIGHT_RED, "❌"),
-        ]
+        # Academic scale table, upper bound is just below the next band
+        scale = []
+        upper = 4.00
+        for low, grade, standing in STANDING_BANDS:
+            color, icon = UIConfig.STANDING_STYLES[grade]
+            scale.append((upper, low, grade, standing, color, icon))
+            upper = low - 0.01
         
         print(f"{UIConfig.Colors.BRIGHT_WHITE}{'GPA Range':^12} {'Grade':^8} {'Standing':^20} {'Status':^15}{UIConfig.Colors.RESET}")
         print(f"{UIConfig.Colors.GRAY}{'─'*55}{UIConfig.Colors.RESET}")
@@ -580,19 +689,20 @@ class GradeReportModule:
         """Display academic information based on GPA"""
         print(f"{UIConfig.Colors.BRIGHT_WHITE}Academic Standing:{UIConfig.Colors.RESET}")
         
-        if gpa >= 3.7:
+        grade, _ = standing_for(gpa)
+        if grade == "A":
             print(f"{UIConfig.Colors.BRIGHT_GREEN}🏆 Excellent - First Class Honors!")
             print("Outstanding academic performance. Eligible for honors programs.")
-        elif gpa >= 3.3:
+        elif grade == "B+":
             print(f"{UIConfig.Colors.GREEN}⭐ Very Good - Upper Second Class")
             print("Strong academic record. Consider research opportunities.")
-        elif gpa >= 3.0:
+        elif grade == "B":
             print(f"{UIConfig.Colors.YELLOW}✨ Good - Lower Second Class")
             print("Solid performance. Maintain current study habits.")
-        elif gpa >= 2.7:
+        elif grade == "C+":
             print(f"{UIConfig.Colors.BRIGHT_YELLOW}👍 Satisfactory - Third Class")
             print("Meeting requirements. Room for improvement in some areas.")
-        elif gpa >= 2.0:
+        elif grade in ("C", "D"):
             print(f"{UIConfig.Colors.RED}⚠️  Conditional - Minimum Passing")
             print("Academic probation risk. Consider academic counseling.")
         else:
@@ -643,6 +753,10 @@ class GPACalculatorApp:
                         UIUtils.print_error("Invalid choice! Please select 1-5.")
                         time.sleep(1)
                         
+                except EOFError:
+                    # Input closed (Ctrl-D or a remote client disconnected)
+                    self.running = False
+                    
                 except KeyboardInterrupt:
                     print(f"\n{UIConfig.Colors.YELLOW}Operation interrupted.{UIConfig.Colors.RESET}")
                     if UIUtils.confirm_action("Exit the application?"):
@@ -1,29 +1,198 @@
-courses = []
+from gradesreport.gradereport import SCALES, get_scale, active_scale_name, add_scale_check
+from result.resultsservice import results_by_course, rename_course_results, delete_course_results, touch_course, check_policy, locked, REJECT, REPLACE
+
+# Keyed by course ID so lookups, renames and deletes are O(1) per course.
+courses = {}
+
+# Applies when a course ID is added twice; "reject" or "replace".
+DUPLICATE_POLICY = REJECT
+
+def _check_recorded_grades(course_id, compiled):
+    # Grades already recorded for the course must exist in the new scale,
+    # otherwise they would silently count as 0 points.
+    for record in results_by_course.get(course_id, {}).values():
+        if record["grade"] not in compiled["codes"]:
+            raise ValueError(f"Course {course_id} has grade {record['grade']} which the "
+                             f"{compiled['name']} scale does not know.")
+
+def check_scale_change(course_id, scale):
+    if scale is not None and scale not in SCALES:
+        raise ValueError(f"Unknown grading scale: {scale}")
+    _check_recorded_grades(course_id, get_scale(scale))
+
+@locked
+def check_scale_in_use(name, compiled):
+    # Re-registering a scale or switching the default re-grades every course
+    # on it; name is None for the courses that use the default.
+    for course_id, course in courses.items():
+        scale = course["scale"]
+        if scale == name or (scale is None and name == active_scale_name()):
+            _check_recorded_grades(course_id, compiled)
+
+add_scale_check(check_scale_in_use)
+
+# Passed as store_course's scale to keep a replaced course's current scale
+KEEP_SCALE = object()
+
+@locked
+def store_course(course_id, title, credit, scale=KEEP_SCALE, policy=None):
+    policy = check_policy(policy or DUPLICATE_POLICY, (REJECT, REPLACE))
+
+    existing = courses.get(course_id)
+    if existing is not None:
+        if policy == REJECT:
+            return "rejected"
+        if scale is KEEP_SCALE:
+            scale = existing["scale"]
+        else:
+            check_scale_change(course_id, scale)
+        existing.update({"title": title, "credit": float(credit), "scale": scale})
+        touch_course(course_id)
+        return "replaced"
+
+    if scale is KEEP_SCALE:
+        scale = None
+    elif scale is not None and scale not in SCALES:
+        raise ValueError(f"Unknown grading scale: {scale}")
+
+    courses[course_id] = {
+        "id": course_id,
+        "title": title,
+        "credit": float(credit),
+        "scale": scale
+    }
+    return "added"
 
 def add_course():
     course_id = input("Enter Course ID: ")
     title = input("Enter Course Title: ")
     credit = float(input("Enter Credit Hour: "))
+    scale = input("Enter Grading Scale (blank for default): ").strip() or None
 
-    courses.append({
-        "id": course_id,
-        "title": title,
-        "credit": credit
-    })
-    print("Course added successfully.\n")
+    if scale is not None and scale not in SCALES:
+        print(f"Unknown grading scale. Choose from: {', '.join(SCALES)}\n")
+        return
+
+    outcome = store_course(course_id, title, credit, scale)
+    if outcome == "rejected":
+        print("A course with this ID already exists.\n")
+    elif outcome == "replaced":
+        print("Existing course updated successfully.\n")
+    else:
+        print("Course added successfully.\n")
+    return outcome
 
+@locked
+def import_courses(rows, policy=None):
+    # rows: iterable of {"id", "title", "credit", "scale"?}. Returns a count
+    # per outcome; rows with an unknown scale, or a scale that does not know
+    # grades already recorded for the course, are counted as "invalid". A
+    # replaced course keeps its scale when the row has no "scale" key.
+    policy = check_policy(policy or DUPLICATE_POLICY, (REJECT, REPLACE))
+    summary = {"added": 0, "replaced": 0, "rejected": 0, "invalid": 0}
+    for row in rows:
+        try:
+            outcome = store_course(row["id"], row["title"], row["credit"], row.get("scale", KEEP_SCALE), policy)
+        except ValueError:
+            outcome = "invalid"
+        summary[outcome] += 1
+    return summary
+
+@locked
 def list_courses():
     if not courses:
         print("No courses registered.\n")
         return
 
     print("\nAvailable Courses:")
-    for c in courses:
-        print(f"ID: {c['id']} | Title: {c['title']} | Credit: {c['credit']}")
+    for c in courses.values():
+        print(f"ID: {c['id']} | Title: {c['title']} | Credit: {c['credit']} | Scale: {c.get('scale') or 'default'}")
     print()
 
 def find_course(course_id):
-    for c in courses:
-        if c["id"] == course_id:
-            return c
-    return None
+    return courses.get(course_id)
+
+@locked
+def update_courses(changes):
+    # changes: {course_id: {"id": ..., "title": ..., "credit": ..., "scale": ...}},
+    # any field optional. Validate every change first so a bad entry leaves
+    # the store unchanged.
+    renames = {}
+    for course_id, fields in changes.items():
+        if course_id not in courses:
+            raise ValueError(f"Unknown course ID: {course_id}")
+        if "scale" in fields:
+            check_scale_change(course_id, fields["scale"])
+        if "credit" in fields and float(fields["credit"]) < 0:
+            raise ValueError(f"Credit cannot be negative for course {course_id}.")
+        new_id = fields.get("id", course_id)
+        if new_id != course_id:
+            renames[course_id] = new_id
+
+    targets = set(renames.values())
+    if len(targets) != len(renames):
+        raise ValueError("Two courses cannot be renamed to the same ID.")
+    for new_id in targets:
+        if new_id in courses and new_id not in renames:
+            raise ValueError(f"Course ID already exists: {new_id}")
+
+    records = {course_id: courses.pop(course_id) for course_id in renames}
+    for course_id, fields in changes.items():
+        record = records.get(course_id) or courses[course_id]
+        record.update(fields)
+        if "credit" in fields:
+            record["credit"] = float(fields["credit"])
+        if course_id in renames:
+            courses[record["id"]] = record
+
+    # Move results through a placeholder key so swapped IDs do not collide
+    for old_id in renames:
+        rename_course_results(old_id, ("renaming", old_id))
+    for old_id, new_id in renames.items():
+        rename_course_results(("renaming", old_id), new_id)
+
+    for course_id, fields in changes.items():
+        if "credit" in fields or "scale" in fields:
+            touch_course(fields.get("id", course_id))
+    return len(changes)
+
+@locked
+def delete_courses(course_ids):
+    deleted = 0
+    for course_id in course_ids:
+        if courses.pop(course_id, None) is not None:
+            delete_course_results(course_id)
+            deleted += 1
+    return deleted
+
+def update_course():
+    course_id = input("Enter Course ID: ")
+    if course_id not in courses:
+        print("Course not found.\n")
+        return
+
+    new_id = input("Enter New Course ID (blank to keep): ").strip()
+    title = input("Enter New Title (blank to keep): ").strip()
+    credit = input("Enter New Credit Hour (blank to keep): ").strip()
+
+    fields = {}
+    if new_id:
+        fields["id"] = new_id
+    if title:
+        fields["title"] = title
+    if credit:
+        fields["credit"] = credit
+
+    try:
+        update_courses({course_id: fields})
+    except ValueError as e:
+        print(f"{e}\n")
+        return
+    print("Course updated successfully.\n")
+
+def delete_course():
+    course_id = input("Enter Course ID: ")
+    if not delete_courses([course_id]):
+        print("Course not found.\n")
+        return
+    print("Course and its results deleted.\n")
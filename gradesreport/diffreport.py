@@ -0,0 +1,100 @@
+import csv
+
+from gradesreport.gradereport import gpa_from_totals, standing_for, scale_generation
+from result.resultsservice import (take_dirty_students, pending_students, return_dirty_students,
+                                   student_totals, store_lock)
+
+# Snapshot from the previous committed run: the scale generation it was
+# computed under and {student_id: (gpa, standing)}. Only one consumer (the
+# scheduled export) should commit; interactive sessions preview instead.
+last_run = {"scale_generation": None, "students": {}}
+
+def differential_report(student_finder, course_finder, export_path=None, commit=True):
+    # Recomputes only students touched since the last committed run and
+    # returns one row per student whose GPA or standing moved, was added or
+    # removed. Re-registering or switching scales invalidates every
+    # snapshot, so all are redone.
+    #
+    # A committing run consumes the pending changes and moves the snapshot
+    # forward, but only once the export (if any) has been written; if
+    # anything fails the changes stay pending for the next run. With
+    # commit=False the report is a preview that leaves both untouched.
+    with store_lock:
+        generation = scale_generation()
+        changed = take_dirty_students() if commit else pending_students()
+        try:
+            if generation != last_run["scale_generation"]:
+                changed.update(last_run["students"])
+
+            recomputed = []
+            for student_id in sorted(changed, key=str):
+                student = student_finder(student_id)
+                if student is not None:
+                    totals = student_totals(student_id, course_finder)
+                    gpa = gpa_from_totals(*totals)
+                    standing = standing_for(gpa)[1] if totals[1] else "Not graded"
+                    recomputed.append((student, gpa, standing))
+
+            diff = _compare(last_run["students"], changed, recomputed)
+
+            # Written under the lock so no other run can commit in between
+            if export_path:
+                export_students(export_path, recomputed)
+        except BaseException:
+            if commit:
+                return_dirty_students(changed)
+            raise
+
+        if commit:
+            snapshot = last_run["students"]
+            for row in diff:
+                if row["status"] == "removed":
+                    del snapshot[row["student_id"]]
+                else:
+                    snapshot[row["student_id"]] = (row["new_gpa"], row["new_standing"])
+            last_run["scale_generation"] = generation
+
+    return diff
+
+def _compare(snapshot, changed, recomputed):
+    diff = []
+    for student, gpa, standing in recomputed:
+        student_id = student["id"]
+        previous = snapshot.get(student_id)
+        if previous is None:
+            status = "added"
+        elif previous != (gpa, standing):
+            status = "changed"
+        else:
+            continue
+
+        old_gpa, old_standing = previous or (None, None)
+        diff.append({
+            "student_id": student_id,
+            "status": status,
+            "old_gpa": old_gpa,
+            "new_gpa": gpa,
+            "old_standing": old_standing,
+            "new_standing": standing
+        })
+
+    current_ids = {student["id"] for student, _, _ in recomputed}
+    for student_id in sorted(changed - current_ids, key=str):
+        previous = snapshot.get(student_id)
+        if previous is not None:
+            diff.append({
+                "student_id": student_id,
+                "status": "removed",
+                "old_gpa": previous[0],
+                "new_gpa": None,
+                "old_standing": previous[1],
+                "new_standing": None
+            })
+    return diff
+
+def export_students(path, recomputed):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["student_id", "name", "gpa", "standing"])
+        for student, gpa, standing in recomputed:
+            writer.writerow([student["id"], student.get("name", ""), f"{gpa:.2f}", standing])
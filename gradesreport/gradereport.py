@@ -1,3 +1,7 @@
+import json
+import math
+from bisect import bisect_right
+
 GRADE_POINTS = {
     "A": 4.0,
     "B+": 3.5,
@@ -8,7 +12,211 @@ GRADE_POINTS = {
     "F": 0.0
 }
 
-def calculate_gpa(student_id, results_list, course_finder):
+# Built-in scale definitions. A definition maps counted grades to points,
+# lists grades that are recorded but excluded from GPA ("non_gpa"), and may
+# carry minimum-percentage bands used to convert numeric marks to letters.
+SCALE_DEFINITIONS = [
+    {
+        "name": "standard",
+        "grades": GRADE_POINTS,
+        "non_gpa": ["P", "NP"],
+        "percent": [[90, "A"], [85, "B+"], [80, "B"], [75, "C+"], [70, "C"], [60, "D"], [0, "F"]]
+    },
+    {
+        "name": "plus_minus",
+        "grades": {
+            "A": 4.0, "A-": 3.7,
+            "B+": 3.3, "B": 3.0, "B-": 2.7,
+            "C+": 2.3, "C": 2.0, "C-": 1.7,
+            "D+": 1.3, "D": 1.0,
+            "F": 0.0
+        },
+        "non_gpa": ["P", "NP"],
+        "percent": [[93, "A"], [90, "A-"], [87, "B+"], [83, "B"], [80, "B-"], [77, "C+"],
+                    [73, "C"], [70, "C-"], [67, "D+"], [60, "D"], [0, "F"]]
+    },
+    {
+        "name": "pass_fail",
+        "grades": {},
+        "non_gpa": ["P", "NP"]
+    }
+]
+
+# GPA standing bands: (minimum GPA, letter, standing), highest first.
+STANDING_BANDS = [
+    (3.7, "A", "First Class Honors"),
+    (3.3, "B+", "Upper Second Class"),
+    (3.0, "B", "Lower Second Class"),
+    (2.7, "C+", "Third Class"),
+    (2.3, "C", "Pass"),
+    (2.0, "D", "Conditional Pass"),
+    (0.0, "F", "Fail")
+]
+
+_STANDING_CUTS = [band[0] for band in reversed(STANDING_BANDS)]
+_STANDING_LABELS = [(band[1], band[2]) for band in reversed(STANDING_BANDS)]
+
+SCALES = {}
+DEFAULT_SCALE = "standard"
+_active_scale = DEFAULT_SCALE
+
+# Bumped whenever a scale is (re)registered or the active scale changes, so
+# caches of computed totals can tell they were built under older tables.
+_scale_generation = 0
+
+# Called as check(name, compiled) before scale `name` is replaced by
+# `compiled`; name is None when compiled is about to become the default for
+# courses without a scale of their own. A check raises ValueError to refuse.
+_scale_checks = []
+
+def compile_scale(definition):
+    name = definition.get("name")
+    if not name:
+        raise ValueError("Grading scale needs a name.")
+
+    # Every known letter gets an integer code; points and counted are
+    # indexed by that code so a lookup is one dict hit plus a list index.
+    codes = {}
+    letters = []
+    points = []
+    counted = []
+
+    for grade, value in definition.get("grades", {}).items():
+        grade = grade.strip().upper()
+        if grade in codes:
+            raise ValueError(f"Grade {grade} defined twice in scale {name}.")
+        codes[grade] = len(letters)
+        letters.append(grade)
+        points.append(float(value))
+        counted.append(True)
+
+    for grade in definition.get("non_gpa", []):
+        grade = grade.strip().upper()
+        if grade in codes:
+            raise ValueError(f"Grade {grade} defined twice in scale {name}.")
+        codes[grade] = len(letters)
+        letters.append(grade)
+        points.append(0.0)
+        counted.append(False)
+
+    percent_cuts = []
+    percent_letters = []
+    for minimum, grade in sorted(definition.get("percent", []), key=lambda band: band[0]):
+        grade = grade.strip().upper()
+        if grade not in codes:
+            raise ValueError(f"Percent band refers to unknown grade {grade} in scale {name}.")
+        percent_cuts.append(float(minimum))
+        percent_letters.append(grade)
+
+    # Counted grades from lowest to highest points, for bisecting a
+    # required average onto a letter.
+    ladder = sorted((points[code], -code, letters[code]) for code in range(len(letters)) if counted[code])
+
+    return {
+        "name": name,
+        "codes": codes,
+        "letters": letters,
+        "points": points,
+        "counted": counted,
+        "percent_cuts": percent_cuts,
+        "percent_letters": percent_letters,
+        "ladder_points": [step[0] for step in ladder],
+        "ladder_letters": [step[2] for step in ladder]
+    }
+
+def add_scale_check(check):
+    _scale_checks.append(check)
+
+def _check_scale(name, compiled):
+    for check in _scale_checks:
+        check(name, compiled)
+
+def _store_scales(compiled_scales):
+    global _scale_generation
+    for compiled in compiled_scales:
+        SCALES[compiled["name"]] = compiled
+    _scale_generation += 1
+
+def register_scale(definition):
+    compiled = compile_scale(definition)
+    _check_scale(compiled["name"], compiled)
+    _store_scales([compiled])
+    return compiled
+
+def load_scales(path):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        data = [data]
+
+    # Compile and check every scale first so a bad one registers none
+    compiled_scales = [compile_scale(definition) for definition in data]
+    for compiled in compiled_scales:
+        _check_scale(compiled["name"], compiled)
+    _store_scales(compiled_scales)
+    return [compiled["name"] for compiled in compiled_scales]
+
+def set_active_scale(name):
+    global _active_scale, _scale_generation
+    if name not in SCALES:
+        raise ValueError(f"Unknown grading scale: {name}")
+    if name != _active_scale:
+        _check_scale(None, SCALES[name])
+    _active_scale = name
+    _scale_generation += 1
+
+def get_scale(name=None):
+    return SCALES[name or _active_scale]
+
+def active_scale_name():
+    return _active_scale
+
+def scale_generation():
+    return _scale_generation
+
+def scale_for_course(course, scale=None):
+    # A course-level scale (e.g. pass/fail) wins over the caller's choice.
+    return SCALES[course.get("scale") or scale or _active_scale]
+
+def normalize_grade(raw, scale=None):
+    compiled = scale if isinstance(scale, dict) else get_scale(scale)
+    value = raw.strip().upper()
+
+    if value in compiled["codes"]:
+        return value
+
+    if compiled["percent_cuts"]:
+        try:
+            mark = float(value.rstrip("%"))
+        except ValueError:
+            return None
+        # NaN compares False against everything, so check finiteness first
+        if not math.isfinite(mark) or not 0 <= mark <= 100:
+            return None
+        index = bisect_right(compiled["percent_cuts"], mark) - 1
+        if index >= 0:
+            return compiled["percent_letters"][index]
+
+    return None
+
+def grade_rank(grade, scale=None):
+    # Orders grades within a scale: higher points first, then the order the
+    # scale lists them in (so P outranks NP on a pass/fail scale).
+    compiled = scale if isinstance(scale, dict) else get_scale(scale)
+    code = compiled["codes"].get(grade)
+    if code is None:
+        return (-1.0, 0)
+    return (compiled["points"][code], -code)
+
+def standing_for(gpa):
+    index = bisect_right(_STANDING_CUTS, gpa) - 1
+    return _STANDING_LABELS[max(index, 0)]
+
+for _definition in SCALE_DEFINITIONS:
+    register_scale(_definition)
+
+def gpa_totals(student_id, results_list, course_finder, scale=None):
     total_points = 0
     total_credits = 0
 
@@ -16,13 +224,24 @@ def calculate_gpa(student_id, results_list, course_finder):
         if r["student_id"] == student_id:
             course = course_finder(r["course_id"])
             if course:
+                compiled = scale_for_course(course, scale)
+                code = compiled["codes"].get(r["grade"])
+                if code is not None and not compiled["counted"][code]:
+                    continue
+
                 credit = course["credit"]
-                grade_value = GRADE_POINTS.get(r["grade"], 0)
+                grade_value = compiled["points"][code] if code is not None else 0
 
                 total_credits += credit
                 total_points += (grade_value * credit)
 
+    return total_points, total_credits
+
+def gpa_from_totals(total_points, total_credits):
     if total_credits == 0:
         return 0
 
     return round(total_points / total_credits, 2)
+
+def calculate_gpa(student_id, results_list, course_finder, scale=None):
+    return gpa_from_totals(*gpa_totals(student_id, results_list, course_finder, scale))
@@ -0,0 +1,69 @@
+from bisect import bisect_left
+
+from gradesreport.gradereport import get_scale, gpa_from_totals
+
+# What-if projections work on a student's running (points, credits) totals,
+# as returned by gpa_totals or the results service cache, so history is
+# never re-read. Hypothetical courses are (credit, grade) pairs graded on
+# one scale (the active scale unless another is given).
+
+def _compiled(scale):
+    return scale if isinstance(scale, dict) else get_scale(scale)
+
+def add_courses(totals, courses, scale=None):
+    compiled = _compiled(scale)
+    codes = compiled["codes"]
+    points = compiled["points"]
+    counted = compiled["counted"]
+    total_points, total_credits = totals
+
+    for credit, grade in courses:
+        code = codes.get(grade)
+        if code is None:
+            raise ValueError(f"Grade {grade} not in the {compiled['name']} scale.")
+        if counted[code]:
+            total_points += points[code] * credit
+            total_credits += credit
+
+    return total_points, total_credits
+
+def project_gpa(totals, courses, scale=None):
+    return gpa_from_totals(*add_courses(totals, courses, scale))
+
+def required_average(totals, target, credits):
+    # Grade points per credit needed over `credits` new credits for the
+    # unrounded GPA to reach target.
+    if credits <= 0:
+        raise ValueError("Credits must be positive.")
+
+    total_points, total_credits = totals
+    return (target * (total_credits + credits) - total_points) / credits
+
+def minimum_grade(totals, target, credits, scale=None):
+    # Lowest counted grade which, earned across all `credits`, gives a
+    # reported (rounded) GPA of at least target. None if no grade does.
+    compiled = _compiled(scale)
+    ladder_points = compiled["ladder_points"]
+    total_points, total_credits = totals
+    needed = required_average(totals, target, credits)
+
+    # Rounding to 2 places can lift a GPA up to 0.005, so start one rung
+    # below the exact requirement and confirm against the rounded value.
+    slack = 0.005 * (total_credits + credits) / credits
+    start = bisect_left(ladder_points, needed - slack)
+
+    for index in range(start, len(ladder_points)):
+        projected = gpa_from_totals(total_points + ladder_points[index] * credits, total_credits + credits)
+        if projected >= target:
+            return compiled["ladder_letters"][index]
+    return None
+
+def project_batch(scenarios, scale=None):
+    # scenarios: iterable of (totals, courses). Returns projected GPAs in order.
+    compiled = _compiled(scale)
+    return [gpa_from_totals(*add_courses(totals, courses, compiled)) for totals, courses in scenarios]
+
+def minimum_grade_batch(scenarios, scale=None):
+    # scenarios: iterable of (totals, target, credits). Returns letters (or None) in order.
+    compiled = _compiled(scale)
+    return [minimum_grade(totals, target, credits, compiled) for totals, target, credits in scenarios]
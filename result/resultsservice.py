@@ -1,9 +1,141 @@
-results = []
+import threading
+from functools import wraps
+
+from gradesreport.gradereport import scale_for_course, normalize_grade, grade_rank, gpa_totals, scale_generation
+
+# One lock guards the students, courses and results stores so concurrent
+# sessions see every multi-index change as a single step.
+store_lock = threading.RLock()
+
+def locked(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with store_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+# Duplicate policies shared by the students, courses and results services.
+REJECT = "reject"
+REPLACE = "replace"
+KEEP_BEST = "keep-best"
+POLICIES = (REJECT, REPLACE, KEEP_BEST)
+
+# Applies when a (student, course, term) result is recorded twice.
+DUPLICATE_POLICY = REJECT
+
+# Results are keyed by an internal result ID; the by-student and by-course
+# indexes hold the same records so lookups and cascades touch only the
+# affected rows, and result_keys maps (student, course, term) to its ID.
+results = {}
+results_by_student = {}
+results_by_course = {}
+result_keys = {}
+_next_result_id = 1
+
+# Cached (points, credits) per student, dropped whenever that student's
+# results or the credit/scale of one of their courses change. Entries also
+# carry the scale generation they were built under, so re-registering or
+# switching scales invalidates them all.
+_totals_cache = {}
+
+# Change tracking: every touched student joins dirty_students until the
+# differential report swaps the set out, so it never outgrows the roster.
+dirty_students = set()
+
+def check_policy(policy, allowed=POLICIES):
+    if policy not in allowed:
+        raise ValueError(f"Unknown duplicate policy: {policy}. Choose from: {', '.join(allowed)}")
+    return policy
+
+def _key(record):
+    return (record["student_id"], record["course_id"], record["term"])
+
+def touch_student(student_id):
+    _totals_cache.pop(student_id, None)
+    dirty_students.add(student_id)
+
+@locked
+def take_dirty_students():
+    global dirty_students
+    taken, dirty_students = dirty_students, set()
+    return taken
+
+@locked
+def pending_students():
+    # A copy of the dirty set that leaves it in place
+    return set(dirty_students)
+
+@locked
+def return_dirty_students(student_ids):
+    # Puts back students taken by a report that then failed
+    dirty_students.update(student_ids)
+
+@locked
+def touch_course(course_id):
+    for record in results_by_course.get(course_id, {}).values():
+        touch_student(record["student_id"])
+
+@locked
+def student_totals(student_id, course_finder):
+    generation = scale_generation()
+    cached = _totals_cache.get(student_id)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    totals = gpa_totals(student_id, results_for_student(student_id), course_finder)
+    _totals_cache[student_id] = (generation, totals)
+    return totals
+
+@locked
+def record_result(student_id, course_id, grade, course_finder, term="", policy=None):
+    # Returns (outcome, record): outcome is "added", "replaced", "kept" or
+    # "rejected"; record is the stored result, or the existing one on reject.
+    # The grade (letter or percentage) is normalized and ranked on the
+    # course's own scale; one the scale does not know raises ValueError
+    # rather than being stored to count as 0 points.
+    global _next_result_id
+    policy = check_policy(policy or DUPLICATE_POLICY)
+
+    course = course_finder(course_id)
+    if course is None:
+        raise ValueError(f"Unknown course ID: {course_id}")
+    scale = scale_for_course(course)
+    normalized = normalize_grade(str(grade), scale)
+    if normalized is None:
+        raise ValueError(f"Grade {grade} not valid for the {scale['name']} scale.")
+    grade = normalized
+
+    existing_id = result_keys.get((student_id, course_id, term))
+    if existing_id is not None:
+        existing = results[existing_id]
+        if policy == REJECT:
+            return "rejected", existing
+        if policy == KEEP_BEST and grade_rank(grade, scale) <= grade_rank(existing["grade"], scale):
+            return "kept", existing
+        existing["grade"] = grade
+        touch_student(student_id)
+        return "replaced", existing
+
+    result_id = _next_result_id
+    _next_result_id += 1
+
+    record = {
+        "id": result_id,
+        "student_id": student_id,
+        "course_id": course_id,
+        "term": term,
+        "grade": grade
+    }
+    results[result_id] = record
+    results_by_student.setdefault(student_id, {})[result_id] = record
+    results_by_course.setdefault(course_id, {})[result_id] = record
+    result_keys[(student_id, course_id, term)] = result_id
+    touch_student(student_id)
+    return "added", record
 
 def add_result(students_list, courses_list):
     student_id = input("Enter Student ID: ")
     course_id = input("Enter Course ID: ")
-    grade = input("Enter Letter Grade (A, B+, B, C+, C, D, F): ").upper()
 
     student = students_list(student_id)
     if student is None:
@@ -15,19 +147,146 @@ def add_result(students_list, courses_list):
         print("Course not found.\n")
         return
 
-    results.append({
-        "student_id": student_id,
-        "course_id": course_id,
-        "grade": grade
-    })
-    print("Result added successfully.\n")
+    term = input("Enter Term (blank if none): ").strip()
+
+    scale = scale_for_course(course)
+    prompt = ", ".join(scale["letters"])
+    if scale["percent_cuts"]:
+        prompt += " or a percentage"
+    grade = input(f"Enter Grade ({prompt}): ")
+
+    try:
+        outcome, record = record_result(student_id, course_id, grade, courses_list, term)
+    except ValueError as e:
+        print(f"{e}\n")
+        return
+    if outcome == "rejected":
+        print(f"A result for this student, course and term already exists (grade {record['grade']}).\n")
+    elif outcome == "kept":
+        print(f"Existing grade {record['grade']} is better and was kept.\n")
+    elif outcome == "replaced":
+        print("Existing result replaced successfully.\n")
+    else:
+        print("Result added successfully.\n")
+    return outcome
+
+@locked
+def import_results(rows, students_list, courses_list, policy=None):
+    # rows: iterable of {"student_id", "course_id", "grade", "term"?}.
+    # Returns a count per outcome; rows naming an unknown student/course or
+    # a grade the course's scale rejects are counted as "invalid".
+    policy = check_policy(policy or DUPLICATE_POLICY)
+    summary = {"added": 0, "replaced": 0, "kept": 0, "rejected": 0, "invalid": 0}
+
+    for row in rows:
+        if students_list(row["student_id"]) is None:
+            summary["invalid"] += 1
+            continue
 
+        try:
+            outcome, _ = record_result(row["student_id"], row["course_id"], row["grade"], courses_list,
+                                       row.get("term", ""), policy)
+        except ValueError:
+            outcome = "invalid"
+        summary[outcome] += 1
+    return summary
+
+@locked
 def list_results():
     if not results:
         print("No results found.\n")
         return
 
     print("\nAll Results:")
-    for r in results:
-        print(f"Student ID: {r['student_id']} | Course ID: {r['course_id']} | Grade: {r['grade']}")
+    for r in results.values():
+        print(f"Student ID: {r['student_id']} | Course ID: {r['course_id']} | Term: {r['term'] or '-'} | Grade: {r['grade']}")
     print()
+
+@locked
+def results_for_student(student_id):
+    return list(results_by_student.get(student_id, {}).values())
+
+@locked
+def results_for_course(course_id):
+    return list(results_by_course.get(course_id, {}).values())
+
+def _unlink(record):
+    result_id = record["id"]
+    del results[result_id]
+    del result_keys[_key(record)]
+    touch_student(record["student_id"])
+
+    by_student = results_by_student[record["student_id"]]
+    del by_student[result_id]
+    if not by_student:
+        del results_by_student[record["student_id"]]
+
+    by_course = results_by_course[record["course_id"]]
+    del by_course[result_id]
+    if not by_course:
+        del results_by_course[record["course_id"]]
+
+@locked
+def update_results(changes, course_finder):
+    # changes: {result_id: new grade}. Everything is validated before any
+    # record is touched so a bad entry leaves the store unchanged.
+    validated = []
+    for result_id, raw_grade in changes.items():
+        record = results.get(result_id)
+        if record is None:
+            raise ValueError(f"Unknown result ID: {result_id}")
+        course = course_finder(record["course_id"])
+        grade = normalize_grade(raw_grade, scale_for_course(course)) if course else None
+        if grade is None:
+            raise ValueError(f"Grade {raw_grade} not valid for result {result_id}.")
+        validated.append((record, grade))
+
+    for record, grade in validated:
+        record["grade"] = grade
+        touch_student(record["student_id"])
+    return len(validated)
+
+@locked
+def delete_results(result_ids):
+    deleted = 0
+    for result_id in result_ids:
+        record = results.get(result_id)
+        if record is not None:
+            _unlink(record)
+            deleted += 1
+    return deleted
+
+def delete_student_results(student_id):
+    return delete_results(list(results_by_student.get(student_id, {})))
+
+def delete_course_results(course_id):
+    return delete_results(list(results_by_course.get(course_id, {})))
+
+@locked
+def rename_student_results(old_id, new_id):
+    # Callers touch the old and new IDs once the rename is complete
+    moved = results_by_student.pop(old_id, {})
+    if not moved:
+        return 0
+
+    target = results_by_student.setdefault(new_id, {})
+    for result_id, record in moved.items():
+        del result_keys[_key(record)]
+        record["student_id"] = new_id
+        result_keys[_key(record)] = result_id
+        target[result_id] = record
+    return len(moved)
+
+@locked
+def rename_course_results(old_id, new_id):
+    moved = results_by_course.pop(old_id, {})
+    if not moved:
+        return 0
+
+    target = results_by_course.setdefault(new_id, {})
+    for result_id, record in moved.items():
+        del result_keys[_key(record)]
+        record["course_id"] = new_id
+        result_keys[_key(record)] = result_id
+        target[result_id] = record
+    return len(moved)
@@ -0,0 +1,174 @@
+"""
+GPA Calculator System - Multi-User Session Server
+Serves the terminal menus to many clerks at once over TCP or a Unix socket
+(connect with telnet or nc). All sessions share the same in-memory store.
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from app import GPACalculatorApp
+
+# ==================== SESSION I/O ====================
+_current = threading.local()
+
+class SessionIO:
+    """Text stream for one connection, used from its menu thread"""
+
+    def __init__(self, reader, writer, loop):
+        self.reader = reader
+        self.writer = writer
+        self.loop = loop
+        self.closed = False
+
+    def write(self, text):
+        """Queue text on the socket without waiting for the event loop"""
+        if not self.closed:
+            data = text.replace("\n", "\r\n").encode("utf-8")
+            self.loop.call_soon_threadsafe(self.writer.write, data)
+        return len(text)
+
+    def flush(self):
+        """Wait until the socket buffer drains (blocks this session only)"""
+        if self.closed:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.writer.drain(), self.loop).result()
+        except (ConnectionError, RuntimeError, CancelledError):
+            self.closed = True
+
+    def readline(self):
+        """Read one line from the client; an empty string means it hung up"""
+        if self.closed:
+            return ""
+        self.flush()
+        try:
+            line = asyncio.run_coroutine_threadsafe(self.reader.readline(), self.loop).result()
+        except (ConnectionError, RuntimeError, CancelledError):
+            line = b""
+        if not line:
+            self.closed = True
+            return ""
+
+        # Telnet clients end lines with CRLF
+        return line.decode("utf-8", errors="replace").rstrip("\r\n") + "\n"
+
+    def isatty(self):
+        return False
+
+class SessionDispatch:
+    """Stands in for sys.stdin/sys.stdout and routes to the calling thread's session"""
+
+    def __init__(self, original):
+        self.original = original
+
+    def _target(self):
+        return getattr(_current, "io", None) or self.original
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        return self._target().flush()
+
+    def readline(self):
+        return self._target().readline()
+
+    def isatty(self):
+        return self._target().isatty()
+
+    def fileno(self):
+        # input() only prompts through write/readline when there is no real fd
+        if getattr(_current, "io", None) is not None:
+            raise OSError("session streams have no file descriptor")
+        return self.original.fileno()
+
+    def __getattr__(self, name):
+        return getattr(self.original, name)
+
+# ==================== SESSION SERVER ====================
+class SessionServer:
+    """Accepts connections and runs one GPACalculatorApp per connection"""
+
+    def __init__(self, max_sessions=500):
+        self.max_sessions = max_sessions
+        self.sessions = set()
+        self.executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="session")
+
+    @staticmethod
+    def run_session(io):
+        """Run the menus on this worker thread against the session's streams"""
+        _current.io = io
+        try:
+            GPACalculatorApp().run()
+        finally:
+            _current.io = None
+
+    async def handle(self, reader, writer):
+        """Serve one client until it exits or disconnects"""
+        loop = asyncio.get_running_loop()
+
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(b"Server is busy, please try again later.\r\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        io = SessionIO(reader, writer, loop)
+        self.sessions.add(io)
+        try:
+            await loop.run_in_executor(self.executor, self.run_session, io)
+        except asyncio.CancelledError:
+            # Server shutting down; the session reads EOF once io is closed
+            pass
+        finally:
+            self.sessions.discard(io)
+            io.closed = True
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host=None, port=None, path=None):
+        """Listen on a TCP port or a Unix socket path until cancelled"""
+        sys.stdin = SessionDispatch(sys.stdin)
+        sys.stdout = SessionDispatch(sys.stdout)
+
+        # Let a burst of clerks logging in at once queue instead of being reset
+        backlog = max(100, self.max_sessions)
+        if path:
+            server = await asyncio.start_unix_server(self.handle, path=path, backlog=backlog)
+        else:
+            server = await asyncio.start_server(self.handle, host=host, port=port, backlog=backlog)
+
+        where = path or ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"GPA Calculator session server listening on {where}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Closed sessions read EOF and leave their menus on their own
+            for io in self.sessions:
+                io.closed = True
+            sys.stdin = sys.stdin.original
+            sys.stdout = sys.stdout.original
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+# ==================== SERVER ENTRY POINT ====================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the GPA Calculator menus to many users")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP address to bind (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=2323, help="TCP port to bind (default 2323)")
+    parser.add_argument("--unix", metavar="PATH", help="serve on a Unix socket instead of TCP")
+    parser.add_argument("--max-sessions", type=int, default=500, help="concurrent sessions (default 500)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(SessionServer(args.max_sessions).serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
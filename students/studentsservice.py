@@ -1,27 +1,138 @@
-students = []
+from result.resultsservice import rename_student_results, delete_student_results, touch_student, check_policy, locked, REJECT, REPLACE
+
+# Keyed by student ID so lookups, renames and deletes are O(1) per student.
+students = {}
+
+# Applies when a student ID is added twice; "reject" or "replace".
+DUPLICATE_POLICY = REJECT
+
+@locked
+def store_student(student_id, name, policy=None):
+    policy = check_policy(policy or DUPLICATE_POLICY, (REJECT, REPLACE))
+
+    existing = students.get(student_id)
+    if existing is not None:
+        if policy == REJECT:
+            return "rejected"
+        existing["name"] = name
+        touch_student(student_id)
+        return "replaced"
+
+    students[student_id] = {
+        "id": student_id,
+        "name": name
+    }
+    touch_student(student_id)
+    return "added"
 
 def add_student():
     student_id = input("Enter Student ID: ")
     name = input("Enter Student Name: ")
 
-    students.append({
-        "id": student_id,
-        "name": name
-    })
-    print("Student registered successfully.\n")
+    outcome = store_student(student_id, name)
+    if outcome == "rejected":
+        print("A student with this ID already exists.\n")
+    elif outcome == "replaced":
+        print("Existing student updated successfully.\n")
+    else:
+        print("Student registered successfully.\n")
+    return outcome
+
+@locked
+def import_students(rows, policy=None):
+    # rows: iterable of {"id", "name"}. Returns a count per outcome.
+    policy = check_policy(policy or DUPLICATE_POLICY, (REJECT, REPLACE))
+    summary = {"added": 0, "replaced": 0, "rejected": 0}
+    for row in rows:
+        summary[store_student(row["id"], row["name"], policy)] += 1
+    return summary
 
+@locked
 def list_students():
     if not students:
         print("No students registered.\n")
         return
 
     print("\nRegistered Students:")
-    for s in students:
+    for s in students.values():
         print(f"ID: {s['id']} | Name: {s['name']}")
     print()
 
 def find_student(student_id):
-    for s in students:
-        if s["id"] == student_id:
-            return s
-    return None
+    return students.get(student_id)
+
+@locked
+def update_students(changes):
+    # changes: {student_id: {"id": new_id, "name": new_name}}, any field optional.
+    # Validate every change first so a bad entry leaves the store unchanged.
+    renames = {}
+    for student_id, fields in changes.items():
+        if student_id not in students:
+            raise ValueError(f"Unknown student ID: {student_id}")
+        new_id = fields.get("id", student_id)
+        if new_id != student_id:
+            renames[student_id] = new_id
+
+    targets = set(renames.values())
+    if len(targets) != len(renames):
+        raise ValueError("Two students cannot be renamed to the same ID.")
+    for new_id in targets:
+        if new_id in students and new_id not in renames:
+            raise ValueError(f"Student ID already exists: {new_id}")
+
+    records = {student_id: students.pop(student_id) for student_id in renames}
+    for student_id, fields in changes.items():
+        record = records.get(student_id) or students[student_id]
+        record.update(fields)
+        if student_id in renames:
+            students[record["id"]] = record
+
+    # Move results through a placeholder key so swapped IDs do not collide
+    for old_id in renames:
+        rename_student_results(old_id, ("renaming", old_id))
+    for old_id, new_id in renames.items():
+        rename_student_results(("renaming", old_id), new_id)
+
+    for student_id, fields in changes.items():
+        touch_student(student_id)
+        touch_student(fields.get("id", student_id))
+    return len(changes)
+
+@locked
+def delete_students(student_ids):
+    deleted = 0
+    for student_id in student_ids:
+        if students.pop(student_id, None) is not None:
+            delete_student_results(student_id)
+            touch_student(student_id)
+            deleted += 1
+    return deleted
+
+def update_student():
+    student_id = input("Enter Student ID: ")
+    if student_id not in students:
+        print("Student not found.\n")
+        return
+
+    new_id = input("Enter New Student ID (blank to keep): ").strip()
+    name = input("Enter New Name (blank to keep): ").strip()
+
+    fields = {}
+    if new_id:
+        fields["id"] = new_id
+    if name:
+        fields["name"] = name
+
+    try:
+        update_students({student_id: fields})
+    except ValueError as e:
+        print(f"{e}\n")
+        return
+    print("Student updated successfully.\n")
+
+def delete_student():
+    student_id = input("Enter Student ID: ")
+    if not delete_students([student_id]):
+        print("Student not found.\n")
+        return
+    print("Student and their results deleted.\n")
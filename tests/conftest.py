@@ -0,0 +1,40 @@
+import pytest
+
+from gradesreport import gradereport, diffreport
+from students import studentsservice
+from courses import coursesservice
+from result import resultsservice
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    # The services keep module-level state; give every test an empty store
+    # and the built-in scales, and leave nothing behind for the next one.
+    def reset():
+        studentsservice.students.clear()
+        coursesservice.courses.clear()
+        resultsservice.results.clear()
+        resultsservice.results_by_student.clear()
+        resultsservice.results_by_course.clear()
+        resultsservice.result_keys.clear()
+        resultsservice._totals_cache.clear()
+        resultsservice.take_dirty_students()
+        diffreport.last_run.update({"scale_generation": None, "students": {}})
+
+        gradereport.SCALES.clear()
+        for definition in gradereport.SCALE_DEFINITIONS:
+            gradereport.register_scale(definition)
+        gradereport.set_active_scale(gradereport.DEFAULT_SCALE)
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture
+def typed(monkeypatch):
+    # Queues answers for the interactive prompts, which read with input()
+    def answer(*lines):
+        pending = iter(lines)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(pending))
+    return answer
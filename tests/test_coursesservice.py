@@ -0,0 +1,87 @@
+"""Duplicate course IDs and course scale changes."""
+
+import pytest
+
+from students.studentsservice import store_student
+from courses import coursesservice
+from courses.coursesservice import add_course, courses, find_course, import_courses, store_course, update_courses
+from result.resultsservice import record_result, student_totals, REJECT, REPLACE, KEEP_BEST
+
+
+@pytest.mark.parametrize("policy, outcome, credit", [(REJECT, "rejected", 3.0), (REPLACE, "replaced", 4.0)])
+def test_add_course_applies_duplicate_policy(typed, monkeypatch, policy, outcome, credit):
+    monkeypatch.setattr(coursesservice, "DUPLICATE_POLICY", policy)
+    store_course("C1", "Math", 3)
+
+    typed("C1", "Maths", "4", "")
+    assert add_course() == outcome
+    assert courses["C1"]["credit"] == credit
+
+
+@pytest.mark.parametrize("policy, summary, title", [
+    (REJECT, {"added": 2, "replaced": 0, "rejected": 1, "invalid": 0}, "Math"),
+    (REPLACE, {"added": 2, "replaced": 1, "rejected": 0, "invalid": 0}, "Maths"),
+])
+def test_import_courses_applies_duplicate_policy(policy, summary, title):
+    rows = [
+        {"id": "C1", "title": "Math", "credit": 3},
+        {"id": "C2", "title": "Physics", "credit": 4},
+        {"id": "C1", "title": "Maths", "credit": 3},
+    ]
+    assert import_courses(rows, policy) == summary
+    assert courses["C1"]["title"] == title
+
+
+def test_courses_do_not_support_keep_best():
+    with pytest.raises(ValueError):
+        store_course("C1", "Math", 3, policy=KEEP_BEST)
+    assert not courses
+
+
+def test_import_counts_unknown_scale_as_invalid():
+    assert import_courses([{"id": "C1", "title": "Math", "credit": 3, "scale": "honours"}])["invalid"] == 1
+    assert not courses
+
+
+def test_scale_change_rejected_when_recorded_grades_are_not_in_new_scale():
+    store_student("S1", "Ann")
+    store_course("C1", "Math", 3)
+    record_result("S1", "C1", "A", find_course)
+    assert student_totals("S1", find_course) == (12.0, 3.0)
+
+    with pytest.raises(ValueError):
+        update_courses({"C1": {"scale": "pass_fail"}})
+    with pytest.raises(ValueError):
+        store_course("C1", "Math", 3, "pass_fail", policy=REPLACE)
+
+    assert courses["C1"]["scale"] is None
+    assert student_totals("S1", find_course) == (12.0, 3.0)
+
+
+def test_scale_change_allowed_when_recorded_grades_exist_in_new_scale():
+    store_student("S1", "Ann")
+    store_course("C1", "Math", 3)
+    record_result("S1", "C1", "B", find_course)
+
+    update_courses({"C1": {"scale": "plus_minus"}})
+    assert courses["C1"]["scale"] == "plus_minus"
+    assert student_totals("S1", find_course) == (9.0, 3.0)
+
+
+def test_replacing_a_course_without_a_scale_keeps_its_scale():
+    store_course("C1", "Math", 3, "plus_minus")
+    summary = import_courses([{"id": "C1", "title": "Maths", "credit": 4}], policy=REPLACE)
+
+    assert summary["replaced"] == 1
+    assert courses["C1"]["scale"] == "plus_minus"
+    assert courses["C1"]["credit"] == 4.0
+
+
+def test_import_counts_incompatible_scale_change_as_invalid():
+    store_student("S1", "Ann")
+    store_course("C1", "Math", 3, "plus_minus")
+    record_result("S1", "C1", "A-", find_course)
+
+    summary = import_courses([{"id": "C1", "title": "Math", "credit": 3, "scale": None}], policy=REPLACE)
+    assert summary["invalid"] == 1
+    assert courses["C1"]["scale"] == "plus_minus"
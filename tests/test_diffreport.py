@@ -0,0 +1,106 @@
+"""Differential report: snapshots, previews and failed exports."""
+
+import csv
+import threading
+
+import pytest
+
+from gradesreport import diffreport
+from gradesreport.gradereport import GRADE_POINTS, calculate_gpa, register_scale
+from students.studentsservice import find_student, import_students, store_student, delete_students
+from courses.coursesservice import find_course, store_course
+from result import resultsservice
+from result.resultsservice import record_result, results_for_student, student_totals
+
+
+def report(**kwargs):
+    diff = diffreport.differential_report(find_student, find_course, **kwargs)
+    return [(row["student_id"], row["status"], row["new_gpa"]) for row in diff]
+
+
+@pytest.fixture
+def reported():
+    store_course("C1", "Math", 3)
+    for student_id in ("S1", "S2"):
+        store_student(student_id, "n")
+        record_result(student_id, "C1", "B", find_course)
+    report()
+
+
+def test_report_consumes_dirty_set():
+    import_students([{"id": f"S{i}", "name": "n"} for i in range(5)])
+    assert len(resultsservice.dirty_students) == 5
+
+    assert len(report()) == 5
+    assert not resultsservice.dirty_students
+    assert report() == []
+
+
+def test_report_lists_changed_and_removed_students(reported):
+    record_result("S1", "C1", "A", find_course, "T2")
+    delete_students(["S2"])
+    assert report() == [("S1", "changed", 3.5), ("S2", "removed", None)]
+    assert set(diffreport.last_run["students"]) == {"S1"}
+
+
+def test_preview_leaves_changes_for_the_committing_run(reported):
+    record_result("S1", "C1", "A", find_course, "T2")
+    snapshot = dict(diffreport.last_run["students"])
+
+    assert report(commit=False) == [("S1", "changed", 3.5)]
+    assert report(commit=False) == [("S1", "changed", 3.5)]
+    assert diffreport.last_run["students"] == snapshot
+
+    assert report() == [("S1", "changed", 3.5)]
+    assert report(commit=False) == []
+
+
+def test_failed_export_keeps_changes_pending(reported, tmp_path):
+    record_result("S1", "C1", "A", find_course, "T2")
+    snapshot = dict(diffreport.last_run["students"])
+
+    with pytest.raises(OSError):
+        report(export_path=tmp_path / "missing" / "out.csv")
+    assert diffreport.last_run["students"] == snapshot
+
+    path = tmp_path / "out.csv"
+    assert report(export_path=path) == [("S1", "changed", 3.5)]
+    with open(path, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f))[1:] == [["S1", "n", "3.50", "Upper Second Class"]]
+
+
+def test_reregistering_a_scale_invalidates_cached_totals_and_report(reported):
+    assert student_totals("S1", find_course) == (9.0, 3.0)
+
+    register_scale({"name": "standard", "grades": dict(GRADE_POINTS, B=2.0), "non_gpa": ["P", "NP"]})
+
+    assert student_totals("S1", find_course) == (6.0, 3.0)
+    assert calculate_gpa("S1", results_for_student("S1"), find_course) == 2.0
+    assert report() == [("S1", "changed", 2.0), ("S2", "changed", 2.0)]
+
+
+def test_concurrent_reports_do_not_lose_changes():
+    import_students([{"id": f"S{i}", "name": "n"} for i in range(50)])
+    store_course("C1", "Math", 3)
+    report()
+
+    def writer(k):
+        for j in range(200):
+            record_result(f"S{(k * 7 + j) % 50}", "C1", "ABCDF"[j % 5], find_course, f"T{k}-{j}")
+
+    def reporter():
+        for _ in range(30):
+            report()
+
+    threads = [threading.Thread(target=writer, args=(k,)) for k in range(4)]
+    threads += [threading.Thread(target=reporter) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report()
+
+    snapshot = diffreport.last_run["students"]
+    for i in range(50):
+        student_id = f"S{i}"
+        assert snapshot[student_id][0] == calculate_gpa(student_id, results_for_student(student_id), find_course)
@@ -0,0 +1,141 @@
+"""Randomized cross-check of every GPA path against the reference scan."""
+
+import random
+
+import pytest
+
+from gradesreport import diffreport
+from gradesreport.gradereport import GRADE_POINTS, SCALES, calculate_gpa, gpa_from_totals
+from gradesreport.projection import project_gpa, project_batch
+from students.studentsservice import students, find_student, import_students, update_students, delete_students
+from courses.coursesservice import courses, find_course, import_courses, update_courses, delete_courses
+from result.resultsservice import (results, record_result, results_for_student, student_totals,
+                                   update_results, delete_results, REPLACE)
+
+
+def baseline_gpa(student_id, results_list, course_finder):
+    # The original single-scale calculate_gpa, kept verbatim as the oracle
+    # for stores that only hold standard-scale grades.
+    total_points = 0
+    total_credits = 0
+
+    for r in results_list:
+        if r["student_id"] == student_id:
+            course = course_finder(r["course_id"])
+            if course:
+                credit = course["credit"]
+                grade_value = GRADE_POINTS.get(r["grade"], 0)
+
+                total_credits += credit
+                total_points += (grade_value * credit)
+
+    if total_credits == 0:
+        return 0
+
+    return round(total_points / total_credits, 2)
+
+
+def grade_choices(course, mixed_scales):
+    # The baseline only knows GRADE_POINTS, so standard-only runs skip P/NP
+    if not mixed_scales:
+        return list(GRADE_POINTS)
+    return SCALES[course["scale"] or "standard"]["letters"]
+
+
+def populate(rng, n_students, n_courses, per_student, mixed_scales):
+    scale_names = [None, "plus_minus", "pass_fail"] if mixed_scales else [None]
+    import_courses([
+        {"id": f"C{i}", "title": f"Course {i}", "credit": rng.choice([0, 1, 1.5, 2, 3, 3, 4, 5]),
+         "scale": rng.choice(scale_names)}
+        for i in range(n_courses)
+    ])
+    import_students([{"id": f"S{i}", "name": f"Student {i}"} for i in range(n_students)])
+
+    for i in range(n_students):
+        for course_id in rng.sample(list(courses), min(per_student, n_courses)):
+            term = rng.choice(["", "2025-FALL", "2026-SPRING"])
+            # An occasional unknown grade must be refused, not stored as 0 points
+            if rng.random() < 0.02:
+                with pytest.raises(ValueError):
+                    record_result(f"S{i}", course_id, "Z", find_course, term, policy=REPLACE)
+            grade = rng.choice(grade_choices(courses[course_id], mixed_scales))
+            record_result(f"S{i}", course_id, grade, find_course, term, policy=REPLACE)
+
+
+def mutate(rng, mixed_scales):
+    result_ids = list(results)
+    for result_id in rng.sample(result_ids, len(result_ids) // 20):
+        letters = grade_choices(find_course(results[result_id]["course_id"]), mixed_scales)
+        update_results({result_id: rng.choice(letters)}, find_course)
+    delete_results(rng.sample(list(results), len(results) // 50))
+
+    # Credit changes always move the value so stale cached totals show up
+    course_ids = list(courses)
+    update_courses({course_id: {"credit": courses[course_id]["credit"] + rng.choice([1, 2])}
+                    for course_id in rng.sample(course_ids, max(2, len(course_ids) // 4))})
+    delete_courses(rng.sample(list(courses), max(1, len(courses) // 20)))
+
+    student_ids = list(students)
+    delete_students(rng.sample(student_ids, len(student_ids) // 50))
+    renamed = rng.sample(list(students), len(students) // 20)
+    update_students({student_id: {"id": f"{student_id}-R"} for student_id in renamed})
+
+
+def assert_paths_match(rng, standard_only, sample=None):
+    # The reference scans every result per student, so large stores check
+    # a random sample of students against it.
+    all_results = list(results.values())
+    ids = list(students)
+    if sample is not None and sample < len(ids):
+        ids = rng.sample(ids, sample)
+
+    reference = {student_id: calculate_gpa(student_id, all_results, find_course) for student_id in ids}
+
+    if standard_only:
+        assert {student_id: baseline_gpa(student_id, all_results, find_course) for student_id in ids} == reference
+
+    indexed = {student_id: calculate_gpa(student_id, results_for_student(student_id), find_course) for student_id in ids}
+    assert indexed == reference
+
+    totals = {student_id: student_totals(student_id, find_course) for student_id in ids}
+    assert {student_id: gpa_from_totals(*totals[student_id]) for student_id in ids} == reference
+    warm = {student_id: gpa_from_totals(*student_totals(student_id, find_course)) for student_id in ids}
+    assert warm == reference
+
+    batched = project_batch([(totals[student_id], []) for student_id in ids])
+    assert dict(zip(ids, batched)) == reference
+
+    diffreport.differential_report(find_student, find_course)
+    snapshot = diffreport.last_run["students"]
+    assert {student_id: snapshot[student_id][0] for student_id in ids} == reference
+
+
+def assert_projection_matches(rng, mixed_scales, samples=50):
+    # A projected course must land exactly where recording it would.
+    default_courses = [course_id for course_id, course in courses.items() if course["scale"] is None]
+
+    for student_id in rng.sample(list(students), min(samples, len(students))):
+        course_id = rng.choice(default_courses)
+        grade = rng.choice(grade_choices(courses[course_id], mixed_scales))
+        projected = project_gpa(student_totals(student_id, find_course), [(courses[course_id]["credit"], grade)])
+
+        record_result(student_id, course_id, grade, find_course, "projection-check")
+        assert projected == calculate_gpa(student_id, results_for_student(student_id), find_course)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("n_students, n_courses, per_student, mixed_scales, sample", [
+    (50, 12, 6, False, None),
+    (50, 12, 6, True, None),
+    (2000, 200, 12, False, 200),
+    (2000, 200, 12, True, 200),
+], ids=["small-standard", "small-mixed", "large-standard", "large-mixed"])
+def test_all_gpa_paths_match_reference(seed, n_students, n_courses, per_student, mixed_scales, sample):
+    rng = random.Random(seed)
+    populate(rng, n_students, n_courses, per_student, mixed_scales)
+
+    assert_paths_match(rng, not mixed_scales, sample)
+    mutate(rng, mixed_scales)
+    assert_paths_match(rng, not mixed_scales, sample)
+    assert_projection_matches(rng, mixed_scales)
+    assert_paths_match(rng, not mixed_scales, sample)
@@ -0,0 +1,40 @@
+"""Single-student GPA must not scale with the total number of results."""
+
+import random
+import time
+
+from gradesreport.gradereport import calculate_gpa
+from students.studentsservice import import_students
+from courses.coursesservice import courses, find_course, import_courses
+from result.resultsservice import record_result, results_for_student
+
+
+def populate(prefix, n_students, per_student=10, n_courses=50):
+    rng = random.Random(n_students)
+    import_courses([{"id": f"C{i}", "title": f"Course {i}", "credit": 3} for i in range(n_courses)])
+    import_students([{"id": f"{prefix}{i}", "name": f"Student {i}"} for i in range(n_students)])
+    for i in range(n_students):
+        for course_id in rng.sample(list(courses), per_student):
+            record_result(f"{prefix}{i}", course_id, rng.choice(["A", "B", "C", "F"]), find_course)
+
+
+def median_single_student_time(student_id, repeats=200):
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        calculate_gpa(student_id, results_for_student(student_id), find_course)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def test_single_student_gpa_is_independent_of_store_size():
+    # Same results per student, 100x the store: an O(total results) path
+    # would be ~100x slower, the indexed path stays flat.
+    populate("A", 200)
+    small = median_single_student_time("A0")
+
+    populate("B", 20000)
+    large = median_single_student_time("B0")
+
+    assert large <= small * 10, f"single-student GPA went from {small * 1e6:.1f}us to {large * 1e6:.1f}us"
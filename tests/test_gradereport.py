@@ -0,0 +1,87 @@
+"""Grading scales: registration, the active scale and grade normalization."""
+
+import json
+
+import pytest
+
+from gradesreport.gradereport import (GRADE_POINTS, SCALES, active_scale_name, load_scales,
+                                      normalize_grade, register_scale, set_active_scale)
+from students.studentsservice import store_student
+from courses.coursesservice import find_course, store_course
+from result.resultsservice import record_result, student_totals
+
+
+def standard_without(grade):
+    return {"name": "standard", "grades": {g: p for g, p in GRADE_POINTS.items() if g != grade}, "non_gpa": ["P", "NP"]}
+
+
+@pytest.fixture
+def graded():
+    # B+ on a default-scale course and A- on a plus/minus course
+    store_student("S1", "Ann")
+    store_course("C1", "Math", 3)
+    store_course("PM", "Physics", 3, "plus_minus")
+    record_result("S1", "C1", "B+", find_course)
+    record_result("S1", "PM", "A-", find_course)
+    return student_totals("S1", find_course)
+
+
+def test_switching_default_to_a_scale_missing_recorded_grades_is_refused(graded):
+    with pytest.raises(ValueError):
+        set_active_scale("pass_fail")
+    assert active_scale_name() == "standard"
+    assert student_totals("S1", find_course) == graded
+
+
+def test_switching_default_ignores_courses_with_their_own_scale(graded):
+    # B+ exists in plus_minus; the A- course keeps its own scale
+    set_active_scale("plus_minus")
+    assert student_totals("S1", find_course) == (3.3 * 3 + 3.7 * 3, 6.0)
+
+
+def test_reregistering_a_scale_without_a_recorded_grade_is_refused(graded):
+    with pytest.raises(ValueError):
+        register_scale(standard_without("B+"))
+    with pytest.raises(ValueError):
+        register_scale({"name": "plus_minus", "grades": {"A": 4.0}})
+    assert "B+" in SCALES["standard"]["codes"]
+    assert student_totals("S1", find_course) == graded
+
+
+def test_reregistering_a_scale_that_keeps_recorded_grades_is_allowed(graded):
+    register_scale(standard_without("D"))
+    assert "D" not in SCALES["standard"]["codes"]
+    assert student_totals("S1", find_course) == graded
+
+
+def test_default_courses_follow_the_active_scale_on_reregister(graded):
+    set_active_scale("plus_minus")
+    with pytest.raises(ValueError):
+        register_scale({"name": "plus_minus", "grades": {"A": 4.0, "A-": 3.7}})
+    # standard is no longer the default, so C1's B+ does not pin it
+    register_scale(standard_without("B+"))
+
+
+def test_load_scales_registers_nothing_when_one_is_refused(graded, tmp_path):
+    path = tmp_path / "scales.json"
+    path.write_text(json.dumps([
+        {"name": "honours", "grades": {"H": 4.0}},
+        standard_without("B+"),
+    ]))
+    with pytest.raises(ValueError):
+        load_scales(path)
+    assert "honours" not in SCALES
+
+
+@pytest.mark.parametrize("raw", ["nan", "NaN%", "inf", "-inf", "1e999", "-1", "100.1"])
+@pytest.mark.parametrize("scale", ["standard", "plus_minus"])
+def test_normalize_grade_rejects_non_finite_and_out_of_range_marks(raw, scale):
+    assert normalize_grade(raw, scale) is None
+
+
+def test_normalize_grade_maps_percentages_to_letters():
+    assert normalize_grade("100") == "A"
+    assert normalize_grade("87%") == "B+"
+    assert normalize_grade("0") == "F"
+    assert normalize_grade("87", "plus_minus") == "B+"
+    assert normalize_grade("87", "pass_fail") is None
@@ -0,0 +1,48 @@
+"""What-if projections on running (points, credits) totals."""
+
+import pytest
+
+from gradesreport.gradereport import GRADE_POINTS
+
+from gradesreport.projection import minimum_grade, minimum_grade_batch, project_gpa, required_average
+
+
+@pytest.mark.parametrize("credits", [0, -3])
+def test_minimum_grade_rejects_non_positive_credits(credits):
+    with pytest.raises(ValueError, match="Credits must be positive"):
+        minimum_grade((30.0, 10.0), 3.0, credits)
+    with pytest.raises(ValueError, match="Credits must be positive"):
+        minimum_grade_batch([((30.0, 10.0), 3.0, 3), ((30.0, 10.0), 3.0, credits)])
+
+
+def test_minimum_grade_without_history():
+    assert minimum_grade((0, 0), 3.0, 3) == "B"
+    assert minimum_grade((0, 0), 0.0, 3) == "F"
+
+
+def test_minimum_grade_unreachable_target():
+    assert minimum_grade((0, 12.0), 3.0, 3) is None
+    assert minimum_grade((0, 0), 4.01, 3) is None
+
+
+def test_minimum_grade_counts_rounding_up():
+    # 3.4955 rounds to 3.50, so B+ is enough even though the exact
+    # average needed is a hair above 3.5
+    totals = (3.491 * 10, 10.0)
+    assert required_average(totals, 3.5, 10) > 3.5
+    assert minimum_grade(totals, 3.5, 10) == "B+"
+    assert project_gpa(totals, [(10, "B+")]) == 3.5
+
+
+def test_minimum_grade_on_another_scale():
+    assert minimum_grade((0, 0), 3.6, 3, "plus_minus") == "A-"
+    assert minimum_grade((0, 0), 3.0, 3, "pass_fail") is None
+
+
+def test_minimum_grade_is_the_lowest_letter_reaching_target():
+    totals = (25.0, 10.0)
+    for target in [1.0, 2.0, 2.5, 2.8]:
+        letter = minimum_grade(totals, target, 4)
+        assert project_gpa(totals, [(4, letter)]) >= target
+        for lower in (grade for grade, points in GRADE_POINTS.items() if points < GRADE_POINTS[letter]):
+            assert project_gpa(totals, [(4, lower)]) < target
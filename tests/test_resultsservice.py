@@ -0,0 +1,125 @@
+"""Duplicate policies for recorded results."""
+
+import pytest
+
+from students.studentsservice import find_student, store_student
+from courses.coursesservice import find_course, store_course
+from result import resultsservice
+from result.resultsservice import (add_result, record_result, import_results, results_for_student,
+                                   REJECT, REPLACE, KEEP_BEST)
+
+
+@pytest.fixture
+def enrolled():
+    store_student("S1", "Ann")
+    store_course("C1", "Math", 3)
+    store_course("PM", "Physics", 3, "plus_minus")
+    store_course("PF", "Seminar", 1, "pass_fail")
+
+
+def grades_for(student_id):
+    return sorted((record["course_id"], record["term"], record["grade"]) for record in results_for_student(student_id))
+
+
+@pytest.mark.parametrize("policy, outcome, kept", [
+    (REJECT, "rejected", "B"),
+    (REPLACE, "replaced", "C"),
+    (KEEP_BEST, "kept", "B"),
+])
+def test_record_result_applies_duplicate_policy(enrolled, policy, outcome, kept):
+    record_result("S1", "C1", "B", find_course, "T1")
+    assert record_result("S1", "C1", "C", find_course, "T1", policy)[0] == outcome
+    assert grades_for("S1") == [("C1", "T1", kept)]
+
+
+def test_keep_best_replaces_with_a_better_grade(enrolled):
+    record_result("S1", "C1", "B", find_course)
+    assert record_result("S1", "C1", "A", find_course, policy=KEEP_BEST)[0] == "replaced"
+    assert grades_for("S1") == [("C1", "", "A")]
+
+
+@pytest.mark.parametrize("course_id, worse, better", [
+    ("PM", "B+", "A-"),
+    ("PF", "NP", "P"),
+])
+def test_keep_best_ranks_on_the_course_scale(enrolled, course_id, worse, better):
+    # A- and P are not standard-scale grades; ranking them on the active
+    # scale would put them below everything.
+    record_result("S1", course_id, worse, find_course)
+    assert record_result("S1", course_id, better, find_course, policy=KEEP_BEST)[0] == "replaced"
+    assert record_result("S1", course_id, worse, find_course, policy=KEEP_BEST)[0] == "kept"
+    assert grades_for("S1") == [(course_id, "", better)]
+
+
+def test_different_terms_are_not_duplicates(enrolled):
+    record_result("S1", "C1", "B", find_course, "T1")
+    assert record_result("S1", "C1", "C", find_course, "T2")[0] == "added"
+
+
+@pytest.mark.parametrize("policy, typed_grade, outcome, grade", [
+    (REJECT, "A", "rejected", "A-"),
+    (REPLACE, "B", "replaced", "B"),
+    (KEEP_BEST, "B", "kept", "A-"),
+    (KEEP_BEST, "95", "replaced", "A"),
+])
+def test_add_result_applies_duplicate_policy(enrolled, typed, monkeypatch, policy, typed_grade, outcome, grade):
+    monkeypatch.setattr(resultsservice, "DUPLICATE_POLICY", policy)
+    record_result("S1", "PM", "A-", find_course)
+
+    typed("S1", "PM", "", typed_grade)
+    assert add_result(find_student, find_course) == outcome
+    assert grades_for("S1") == [("PM", "", grade)]
+
+
+def test_add_result_refuses_a_grade_outside_the_course_scale(enrolled, typed):
+    typed("S1", "PF", "", "A")
+    assert add_result(find_student, find_course) is None
+    assert grades_for("S1") == []
+
+
+@pytest.mark.parametrize("policy, summary, grade", [
+    (REJECT, {"added": 1, "replaced": 0, "kept": 0, "rejected": 2, "invalid": 0}, "A-"),
+    (REPLACE, {"added": 1, "replaced": 2, "kept": 0, "rejected": 0, "invalid": 0}, "B"),
+    (KEEP_BEST, {"added": 1, "replaced": 1, "kept": 1, "rejected": 0, "invalid": 0}, "A"),
+])
+def test_import_results_applies_duplicate_policy(enrolled, policy, summary, grade):
+    rows = [
+        {"student_id": "S1", "course_id": "PM", "grade": "A-"},
+        {"student_id": "S1", "course_id": "PM", "grade": "A"},
+        {"student_id": "S1", "course_id": "PM", "grade": "B"},
+    ]
+    assert import_results(rows, find_student, find_course, policy) == summary
+    assert grades_for("S1") == [("PM", "", grade)]
+
+
+def test_import_results_counts_unknown_rows_as_invalid(enrolled):
+    rows = [
+        {"student_id": "S9", "course_id": "C1", "grade": "A"},
+        {"student_id": "S1", "course_id": "C9", "grade": "A"},
+        {"student_id": "S1", "course_id": "PF", "grade": "A"},
+    ]
+    assert import_results(rows, find_student, find_course)["invalid"] == 3
+    assert grades_for("S1") == []
+
+
+def test_unknown_policy_is_rejected(enrolled):
+    with pytest.raises(ValueError):
+        record_result("S1", "C1", "A", find_course, policy="newest")
+
+
+@pytest.mark.parametrize("course_id, grade", [("C1", "ZZZ"), ("C1", "A-"), ("PM", "nan"), ("PF", "B"), ("PF", "75")])
+def test_record_result_rejects_grades_outside_the_course_scale(enrolled, course_id, grade):
+    with pytest.raises(ValueError):
+        record_result("S1", course_id, grade, find_course, "T9")
+    assert grades_for("S1") == []
+
+
+def test_record_result_normalizes_percentages_on_the_course_scale(enrolled):
+    record_result("S1", "C1", "87", find_course)
+    record_result("S1", "PM", " 87% ", find_course)
+    assert grades_for("S1") == [("C1", "", "B+"), ("PM", "", "B+")]
+
+
+def test_record_result_rejects_unknown_course(enrolled):
+    with pytest.raises(ValueError):
+        record_result("S1", "C9", "A", find_course)
@@ -0,0 +1,73 @@
+"""Smoke test: scripted clerk sessions against the session server."""
+
+import asyncio
+import sys
+
+import pytest
+
+from server import SessionServer
+from students.studentsservice import students
+from courses.coursesservice import courses
+from result.resultsservice import results_for_student
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="needs Unix sockets")
+
+
+def script(k):
+    # Add a student, a course and a result, project a grade, then exit
+    return [
+        "1", "2", f"S{k}", f"Student {k}", "0",
+        "2", "2", f"C{k}", f"Course {k}", "3", "", "0",
+        "3", "2", f"S{k}", f"C{k}", "", "A", "0",
+        "4", "3", f"S{k}", "3", "3", "", "0",
+        "5",
+    ]
+
+
+async def run_client(path, lines):
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write("".join(line + "\r\n" for line in lines).encode("utf-8"))
+    await writer.drain()
+    if lines and lines[-1] != "5":
+        # Hang up mid-session instead of exiting from the menu
+        writer.write_eof()
+    output = await reader.read()
+    writer.close()
+    return output.decode("utf-8")
+
+
+async def serve_clients(path, scripts):
+    server = SessionServer(max_sessions=8)
+    task = asyncio.create_task(server.serve(path=str(path)))
+    while not path.exists():
+        await asyncio.sleep(0.01)
+
+    try:
+        outputs = await asyncio.wait_for(
+            asyncio.gather(*(run_client(path, lines) for lines in scripts)), timeout=30)
+        return server, outputs
+    finally:
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+def test_scripted_sessions_share_the_store(tmp_path, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    stdin, stdout = sys.stdin, sys.stdout
+
+    scripts = [script(k) for k in range(3)] + [["1", "2", "S9"]]
+    server, outputs = asyncio.run(serve_clients(tmp_path / "gpa.sock", scripts))
+
+    for output in outputs[:3]:
+        assert "Minimum grade across all 3 credit hours: C" in output
+        assert "Goodbye!" in output
+    assert "Goodbye!" not in outputs[3]
+
+    assert set(students) == {"S0", "S1", "S2"}
+    assert set(courses) == {"C0", "C1", "C2"}
+    for k in range(3):
+        assert [record["grade"] for record in results_for_student(f"S{k}")] == ["A"]
+
+    assert not server.sessions
+    assert (sys.stdin, sys.stdout) == (stdin, stdout)
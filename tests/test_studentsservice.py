@@ -0,0 +1,33 @@
+"""Duplicate student IDs on the interactive and import paths."""
+
+import pytest
+
+from students import studentsservice
+from students.studentsservice import add_student, import_students, store_student, students
+from result.resultsservice import REJECT, REPLACE, KEEP_BEST
+
+
+@pytest.mark.parametrize("policy, outcome, name", [(REJECT, "rejected", "Ann"), (REPLACE, "replaced", "Anne")])
+def test_add_student_applies_duplicate_policy(typed, monkeypatch, policy, outcome, name):
+    monkeypatch.setattr(studentsservice, "DUPLICATE_POLICY", policy)
+    store_student("S1", "Ann")
+
+    typed("S1", "Anne")
+    assert add_student() == outcome
+    assert students["S1"]["name"] == name
+
+
+@pytest.mark.parametrize("policy, summary, name", [
+    (REJECT, {"added": 2, "replaced": 0, "rejected": 1}, "Ann"),
+    (REPLACE, {"added": 2, "replaced": 1, "rejected": 0}, "Anne"),
+])
+def test_import_students_applies_duplicate_policy(policy, summary, name):
+    rows = [{"id": "S1", "name": "Ann"}, {"id": "S2", "name": "Bob"}, {"id": "S1", "name": "Anne"}]
+    assert import_students(rows, policy) == summary
+    assert students["S1"]["name"] == name
+
+
+def test_students_do_not_support_keep_best():
+    with pytest.raises(ValueError):
+        import_students([{"id": "S1", "name": "Ann"}], KEEP_BEST)
+    assert not students